@@ -0,0 +1,79 @@
+"""
+Numba kernels for the CMOS inverter VTC solver
+
+Imported lazily by cmos_inverter_simulation on the first solve, so importing
+the simulation module does not pay for numba. Importing this module raises
+ImportError when numba is not installed.
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def _idev(Vgs, Vds, Vt, beta):
+    """Square-law drain current of a single device (scalar)"""
+    Von = Vgs - Vt
+    if Von <= 0:
+        return 0.0
+    elif Vds >= Von:  # Saturation
+        return 0.5 * beta * Von * Von
+    else:  # Linear region
+        return beta * (Von * Vds - 0.5 * Vds * Vds)
+
+
+@njit(cache=True, fastmath=True)
+def _gds(Vgs, Vds, Vt, beta):
+    """Output conductance dI/dVds of a single device (scalar)"""
+    Von = Vgs - Vt
+    if Von <= 0 or Vds >= Von:
+        return 0.0
+    return beta * (Von - Vds)
+
+
+@njit(cache=True, fastmath=True)
+def _newton_point(vin, vdd, Vtn, Vtp_abs, beta_n, beta_p, tol, max_iter):
+    """Damped Newton solve of I_n = I_p for a single input voltage"""
+    max_step = vdd / 4
+    vout = 0.9 * vdd if vin < vdd / 2 else 0.1 * vdd
+    for _ in range(max_iter):
+        F = (_idev(vin, vout, Vtn, beta_n)
+             - _idev(vdd - vin, vdd - vout, Vtp_abs, beta_p))
+        dF = (_gds(vin, vout, Vtn, beta_n)
+              + _gds(vdd - vin, vdd - vout, Vtp_abs, beta_p))
+        if abs(F) < tol:
+            # One last Newton refinement where the residual has a slope;
+            # flat (both devices off or saturated) points stay where they are
+            if dF > 0:
+                vout = min(max(vout - F / dF, 0.0), vdd)
+            break
+        if dF > 0:
+            step = min(max(F / dF, -max_step), max_step)
+        else:
+            step = max_step if F > 0 else -max_step
+        vout = min(max(vout - step, 0.0), vdd)
+    return vout
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _newton_vtc(Vin, Vdd, Vtn, Vtp_abs, beta_n, beta_p, tol, max_iter, Vout):
+    """Solve every input voltage in Vin into Vout, spread over threads
+    
+    Vin and Vout are C-contiguous (M, N); row m uses the device parameters
+    Vdd[m], Vtn[m], ...
+    """
+    n_rows, n_cols = Vin.shape
+    for k in prange(n_rows * n_cols):
+        m = k // n_cols
+        j = k % n_cols
+        Vout[m, j] = _newton_point(Vin[m, j], Vdd[m], Vtn[m], Vtp_abs[m],
+                                   beta_n[m], beta_p[m], tol, max_iter)
+
+
+@njit(cache=True, fastmath=True)
+def _newton_vtc_serial(Vin, Vdd, Vtn, Vtp_abs, beta_n, beta_p, tol, max_iter, Vout):
+    """Single-threaded _newton_vtc for small solves (e.g. the brentq calls behind Vm)"""
+    n_rows, n_cols = Vin.shape
+    for m in range(n_rows):
+        for j in range(n_cols):
+            Vout[m, j] = _newton_point(Vin[m, j], Vdd[m], Vtn[m], Vtp_abs[m],
+                                       beta_n[m], beta_p[m], tol, max_iter)
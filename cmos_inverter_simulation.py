@@ -11,19 +11,56 @@ Author: Zeyad Mustafa
 Date: June 2025
 """
 
+import copy
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
 import warnings
+from functools import lru_cache
 warnings.filterwarnings('ignore')
 
+
+# Smallest solve handed to the multi-threaded Numba kernel
+_PARALLEL_MIN_POINTS = 1024
+
+
+@lru_cache(maxsize=1)
+def _numba_kernels():
+    """Import the Numba VTC kernels on first use; None when numba is unavailable"""
+    try:
+        import _vtc_kernels
+    except ModuleNotFoundError as e:
+        # Fall back to the NumPy solver only when numba itself is missing;
+        # any other import failure is a real error and must surface
+        if e.name != 'numba':
+            raise
+        return None
+    return _vtc_kernels
+
+
+def _read_only(arr):
+    """Mark a cached array read-only so callers cannot corrupt the cache"""
+    arr.setflags(write=False)
+    return arr
+
+
+@lru_cache(maxsize=32)
+def _linspace(n, stop, dtype=np.float64):
+    """Cached np.linspace(0, stop, n, dtype=dtype)"""
+    return _read_only(np.linspace(0, stop, n, dtype=dtype))
+
+
+@lru_cache(maxsize=32)
+def _logspace(start, stop, n):
+    """Cached logarithmic grid from start to stop (in Hz, not decades)"""
+    return _read_only(np.logspace(np.log10(start), np.log10(stop), n))
+
+
 class CMOSInverter:
     """
     CMOS Inverter simulation class with comprehensive analysis capabilities
     """
     
     def __init__(self, Vdd=5.0, Vtn=1.0, Vtp=-1.0, beta_n=100e-6, beta_p=50e-6, 
-                 CL=10e-12, W_n=2e-6, W_p=4e-6, L=1e-6):
+                 CL=10e-12, W_n=2e-6, W_p=4e-6, L=1e-6, dtype=np.float64):
         """
         Initialize CMOS Inverter parameters
         
@@ -37,6 +74,9 @@ class CMOSInverter:
             W_n: NMOS width (m)
             W_p: PMOS width (m)
             L: Channel length (m)
+            dtype: Floating point type of the VTC arrays, np.float64 or np.float32
+                   (float32 halves memory traffic when only a few significant
+                   digits are needed)
         """
         self.Vdd = Vdd
         self.Vtn = Vtn
@@ -47,87 +87,182 @@ class CMOSInverter:
         self.W_n = W_n
         self.W_p = W_p
         self.L = L
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            # The solver tolerance is only tuned for these two precisions
+            raise ValueError(f"dtype must be float32 or float64, got {self.dtype}")
+        self._Vm = None  # (parameters, Vm) of the last switching threshold solve
         
         # Calculate noise margins and critical points
         self.calculate_critical_points()
     
+    @property
+    def Vtp_abs(self):
+        """PMOS threshold magnitude, derived from Vtp so it never goes stale"""
+        return abs(self.Vtp)
+    
     def nmos_current(self, Vgs, Vds):
-        """Calculate NMOS drain current"""
-        if Vgs <= self.Vtn:
-            return 0
-        elif Vds >= (Vgs - self.Vtn):  # Saturation
-            return 0.5 * self.beta_n * (Vgs - self.Vtn)**2
-        else:  # Linear region
-            return self.beta_n * ((Vgs - self.Vtn) * Vds - 0.5 * Vds**2)
+        """Calculate NMOS drain current (accepts scalars or arrays)"""
+        Vgs = np.asarray(Vgs, dtype=self.dtype)
+        Vds = np.asarray(Vds, dtype=self.dtype)
+        Von = Vgs - self.Vtn  # Overdrive voltage
+        on = Von > 0
+        sat = Vds >= Von
+        I_sat = 0.5 * self.beta_n * Von * Von
+        I_lin = self.beta_n * (Von * Vds - 0.5 * Vds * Vds)
+        return np.where(on, np.where(sat, I_sat, I_lin), 0.0)
     
     def pmos_current(self, Vsg, Vsd):
-        """Calculate PMOS drain current"""
-        if Vsg <= abs(self.Vtp):
-            return 0
-        elif Vsd >= (Vsg - abs(self.Vtp)):  # Saturation
-            return 0.5 * self.beta_p * (Vsg - abs(self.Vtp))**2
-        else:  # Linear region
-            return self.beta_p * ((Vsg - abs(self.Vtp)) * Vsd - 0.5 * Vsd**2)
+        """Calculate PMOS drain current (accepts scalars or arrays)"""
+        Vsg = np.asarray(Vsg, dtype=self.dtype)
+        Vsd = np.asarray(Vsd, dtype=self.dtype)
+        Von = Vsg - self.Vtp_abs  # Overdrive voltage
+        on = Von > 0
+        sat = Vsd >= Von
+        I_sat = 0.5 * self.beta_p * Von * Von
+        I_lin = self.beta_p * (Von * Vsd - 0.5 * Vsd * Vsd)
+        return np.where(on, np.where(sat, I_sat, I_lin), 0.0)
+    
+    @staticmethod
+    def _small_signal(Vgs, Vds, Vt, beta):
+        """Transconductance dI/dVgs and output conductance dI/dVds of one device"""
+        Von = Vgs - Vt
+        on = Von > 0
+        sat = Vds >= Von
+        gm = np.where(on, np.where(sat, beta * Von, beta * Vds), 0.0)
+        gds = np.where(on & ~sat, beta * (Von - Vds), 0.0)
+        return gm, gds
+    
+    def _vtc_residual_and_jac(self, Vin, Vout):
+        """KCL residual I_n - I_p at the output node and its derivative w.r.t. Vout"""
+        Vsg = self.Vdd - Vin
+        Vsd = self.Vdd - Vout
+        F = self.nmos_current(Vin, Vout) - self.pmos_current(Vsg, Vsd)
+        
+        _, gds_n = self._small_signal(Vin, Vout, self.Vtn, self.beta_n)
+        _, gsd_p = self._small_signal(Vsg, Vsd, self.Vtp_abs, self.beta_p)
+        
+        # dI_p/dVout = -gsd_p, so both devices add to the Jacobian
+        return F, gds_n + gsd_p
+    
+    def voltage_gain(self, Vin, Vout):
+        """Analytic dVout/dVin along the VTC from implicit differentiation of KCL"""
+        Vsg = self.Vdd - Vin
+        Vsd = self.Vdd - Vout
+        gm_n, gds_n = self._small_signal(Vin, Vout, self.Vtn, self.beta_n)
+        gm_p, gsd_p = self._small_signal(Vsg, Vsd, self.Vtp_abs, self.beta_p)
+        
+        # dI_n/dVin = gm_n, dI_p/dVin = -gm_p, dI_n/dVout = gds_n, dI_p/dVout = -gsd_p
+        return -(gm_n + gm_p) / (gds_n + gsd_p + 1e-30)
+    
+    def _solve_vtc(self, Vin, out=None, tol=None, max_iter=20):
+        """Solve the output voltage for an array of input voltages with damped Newton
+        
+        The result is written into `out` (a C-contiguous array shaped like Vin)
+        when given, otherwise into a new array. Device parameters may be
+        (M, 1) arrays to solve M inverters at once on an (M, N) Vin.
+        """
+        Vin = np.asarray(Vin, dtype=self.dtype)
+        Vout = np.empty(Vin.shape, dtype=self.dtype) if out is None else out
+        if tol is None:
+            if self.dtype == np.float64:
+                tol = 1e-10
+            else:
+                # float32 cannot resolve 1e-10 A on ~100 uA currents; stop at
+                # 1e-5 of the full-scale NMOS current instead
+                tol = 1e-5 * float(np.max(0.5 * self.beta_n * (self.Vdd - self.Vtn)**2))
+        kernels = _numba_kernels()
+        if kernels is not None:
+            # The kernel works on rows of Vin with one parameter set per row.
+            # Every argument is made C-contiguous, writable and of self.dtype
+            # so numba compiles one signature per dtype, not one per layout.
+            n_cols = Vin.shape[-1] if Vin.ndim else 1
+            rows = Vin.size // n_cols
+            row_shape = Vin.shape[:-1] + (1,)
+            params = [np.require(np.broadcast_to(np.asarray(p, dtype=self.dtype),
+                                                 row_shape).reshape(rows),
+                                 requirements=['C', 'W'])
+                      for p in (self.Vdd, self.Vtn, self.Vtp_abs, self.beta_n, self.beta_p)]
+            # Threads only pay off on whole curves; brentq's scalar calls run serially
+            if Vin.size >= _PARALLEL_MIN_POINTS:
+                newton = kernels._newton_vtc
+            else:
+                newton = kernels._newton_vtc_serial
+            newton(np.require(Vin, requirements=['C', 'W']).reshape(rows, n_cols), *params,
+                   float(tol), int(max_iter), Vout.reshape(rows, n_cols))
+            return Vout
+        
+        max_step = self.Vdd / 4
+        
+        # Initial guess based on simple linear model
+        Vout[...] = np.where(Vin < self.Vdd/2, 0.9 * self.Vdd, 0.1 * self.Vdd)
+        
+        # Points stop independently, exactly like the Numba kernel: once |F| < tol
+        # a point takes one undamped refinement (where dF > 0) and is frozen
+        active = np.ones(Vin.shape, dtype=bool)
+        for _ in range(max_iter):
+            F, dF = self._vtc_residual_and_jac(Vin, Vout)
+            done = active & (np.abs(F) < tol)
+            newton = F / np.where(dF > 0, dF, 1.0)
+            # Where both devices are saturated the residual is flat in Vout;
+            # take a full damped step towards the weaker device instead.
+            step = np.clip(np.where(dF > 0, newton, np.sign(F) * max_step), -max_step, max_step)
+            step = np.where(done, np.where(dF > 0, newton, 0.0), np.where(active, step, 0.0))
+            np.subtract(Vout, step, out=Vout)
+            np.clip(Vout, 0, self.Vdd, out=Vout)
+            active &= ~done
+            if not active.any():
+                break
+        
+        return Vout
     
     def find_vout(self, vin):
         """Find output voltage for given input voltage"""
-        def current_balance(vout):
-            # NMOS current (downward)
-            i_n = self.nmos_current(vin, vout)
-            # PMOS current (upward)
-            i_p = self.pmos_current(self.Vdd - vin, self.Vdd - vout)
-            return i_n - i_p
-        
-        try:
-            # Initial guess based on simple linear model
-            if vin < self.Vdd/2:
-                initial_guess = self.Vdd * 0.9
-            else:
-                initial_guess = self.Vdd * 0.1
+        return self._solve_vtc(vin)[()]
+    
+    @property
+    def Vm(self):
+        """Switching threshold, solved on first access and cached in self._Vm
+        
+        The cache is keyed on the device parameters, so assigning e.g.
+        self.Vdd directly triggers a new solve on the next access.
+        """
+        key = (self.Vdd, self.Vtn, self.Vtp, self.beta_n, self.beta_p, self.dtype)
+        if self._Vm is None or self._Vm[0] != key:
+            from scipy.optimize import brentq
             
-            vout = fsolve(current_balance, initial_guess)[0]
-            return max(0, min(self.Vdd, vout))
-        except:
-            # Fallback to simple model if numerical solution fails
-            return max(0, min(self.Vdd, self.Vdd - vin))
+            # Vout - Vin is Vdd-ish at Vin -> 0 and negative at Vin -> Vdd, so [0, Vdd]
+            # brackets the root and brentq needs no fallback
+            Vm = brentq(lambda vin: self.find_vout(vin) - vin,
+                        1e-6, self.Vdd - 1e-6, xtol=1e-8)
+            self._Vm = (key, Vm)
+        return self._Vm[1]
     
     def calculate_critical_points(self):
         """Calculate critical points for noise margins"""
-        try:
-            # Find switching threshold (Vm)
-            def find_vm(vin):
-                return self.find_vout(vin) - vin
-            
-            self.Vm = fsolve(find_vm, self.Vdd/2)[0]
-            
-            # Approximate noise margins (simplified)
-            self.VOL = 0.1 * self.Vdd  # Output low
-            self.VOH = 0.9 * self.Vdd  # Output high
-            self.VIL = self.Vtn  # Input low
-            self.VIH = self.Vdd + self.Vtp  # Input high
-            
-            # Noise margins
-            self.NML = self.VIL - self.VOL  # Low noise margin
-            self.NMH = self.VOH - self.VIH  # High noise margin
-            
-        except:
-            # Default values if calculation fails
-            self.Vm = self.Vdd / 2
-            self.VOL = 0.1 * self.Vdd
-            self.VOH = 0.9 * self.Vdd
-            self.VIL = self.Vtn
-            self.VIH = self.Vdd + self.Vtp
-            self.NML = 0.4
-            self.NMH = 0.4
+        self._Vm = None  # Re-solve the switching threshold on next access
+        
+        # Approximate noise margins (simplified)
+        self.VOL = 0.1 * self.Vdd  # Output low
+        self.VOH = 0.9 * self.Vdd  # Output high
+        self.VIL = self.Vtn  # Input low
+        self.VIH = self.Vdd - self.Vtp_abs  # Input high
+        
+        # Noise margins
+        self.NML = self.VIL - self.VOL  # Low noise margin
+        self.NMH = self.VOH - self.VIH  # High noise margin
     
     def generate_vtc(self, points=200):
         """Generate Voltage Transfer Characteristic"""
-        self.Vin = np.linspace(0, self.Vdd, points)
-        self.Vout = np.array([self.find_vout(vin) for vin in self.Vin])
+        self.Vin = _linspace(points, self.Vdd, self.dtype)
+        self.Vout = np.empty_like(self.Vin)
+        self._solve_vtc(self.Vin, out=self.Vout)
         return self.Vin, self.Vout
     
     def plot_vtc(self, save_fig=False):
         """Plot Voltage Transfer Characteristic with enhanced features"""
+        import matplotlib.pyplot as plt
+        
         if not hasattr(self, 'Vin'):
             self.generate_vtc()
         
@@ -153,7 +288,7 @@ class CMOSInverter:
         
         # Gain plot
         plt.subplot(2, 2, 2)
-        gain = -np.gradient(self.Vout, self.Vin)
+        gain = -self.voltage_gain(self.Vin, self.Vout)
         plt.plot(self.Vin, gain, 'r-', linewidth=2)
         plt.xlabel('Input Voltage (V)', fontsize=12)
         plt.ylabel('Gain (dVout/dVin)', fontsize=12)
@@ -163,7 +298,7 @@ class CMOSInverter:
         
         # Current vs Input Voltage
         plt.subplot(2, 2, 3)
-        current = np.array([self.nmos_current(vin, self.find_vout(vin)) for vin in self.Vin])
+        current = self.nmos_current(self.Vin, self.Vout)
         plt.semilogy(self.Vin, np.abs(current) * 1e6, 'g-', linewidth=2)
         plt.xlabel('Input Voltage (V)', fontsize=12)
         plt.ylabel('Supply Current (μA)', fontsize=12)
@@ -192,7 +327,9 @@ class CMOSInverter:
     
     def transient_analysis(self, tr=1e-9, tf=1e-9, period=20e-9, save_fig=False):
         """Perform transient analysis"""
-        t = np.linspace(0, period, 1000)
+        import matplotlib.pyplot as plt
+        
+        t = _linspace(1000, period)
         
         # Generate square wave input
         vin_transient = np.where(t < period/2, 0, self.Vdd)
@@ -200,22 +337,23 @@ class CMOSInverter:
         # Simplified RC response (more accurate would require solving differential equations)
         tau = 2.2 * (self.W_n/self.L) * self.CL / self.beta_n  # Rough approximation
         
-        vout_transient = np.zeros_like(t)
-        for i, vin in enumerate(vin_transient):
-            if i == 0:
-                vout_transient[i] = self.Vdd if vin == 0 else 0
-            else:
-                # Simple exponential transition
-                if vin != vin_transient[i-1]:  # Transition detected
-                    target = self.Vdd if vin == 0 else 0
-                    vout_transient[i] = target
-                else:
-                    vout_transient[i] = vout_transient[i-1]
-        
-        # Apply RC filtering for more realistic response
-        from scipy.signal import filtfilt, butter
-        b, a = butter(3, 1/(tau * 1e9), 'low')
-        vout_transient = filtfilt(b, a, vout_transient)
+        # Single-pole edge time constant, chosen to match the -3 dB cutoff of the
+        # low-pass smoothing previously applied (1/(tau*1e9) of Nyquist)
+        tau_edge = tau * 1e9 * (t[1] - t[0]) / np.pi
+        
+        # Ideal inverter output; each input edge starts an exponential towards it
+        vout_ideal = np.where(vin_transient == 0, self.Vdd, 0.0)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(vin_transient) != 0) + 1, [t.size]))
+        
+        vout_transient = np.empty_like(t)
+        v0 = vout_ideal[0]  # Settled before the first sample
+        for s, e in zip(starts[:-1], starts[1:]):
+            target = vout_ideal[s]
+            decay = np.exp(-(t[s:e] - t[s]) / tau_edge)
+            vout_transient[s:e] = target + (v0 - target) * decay
+            if e < t.size:
+                # Carry the output voltage across the edge at t[e]
+                v0 = target + (v0 - target) * np.exp(-(t[e] - t[s]) / tau_edge)
         
         plt.figure(figsize=(12, 6))
         
@@ -254,22 +392,30 @@ class CMOSInverter:
     
     def power_analysis(self, frequency_range=(1e3, 1e9), save_fig=False):
         """Analyze power consumption vs frequency"""
-        frequencies = np.logspace(np.log10(frequency_range[0]), np.log10(frequency_range[1]), 50)
+        import matplotlib.pyplot as plt
+        
+        frequencies = _logspace(frequency_range[0], frequency_range[1], 50)
         
         # Static power (leakage) - simplified
         P_static = 1e-9  # 1 nW
         
         # Dynamic power: P = α * CL * Vdd² * f
         alpha = 0.5  # Activity factor
-        P_dynamic = alpha * self.CL * self.Vdd**2 * frequencies
+        P_dynamic = np.multiply(frequencies, alpha * self.CL * self.Vdd**2)
+        
+        P_total = np.add(P_dynamic, P_static)
         
-        P_total = P_static + P_dynamic
+        # Scale to nW into one preallocated buffer (rows: dynamic, total)
+        P_plot = np.empty((2, frequencies.size))
+        np.multiply(P_dynamic, 1e9, out=P_plot[0])
+        np.multiply(P_total, 1e9, out=P_plot[1])
         
         plt.figure(figsize=(10, 6))
-        plt.loglog(frequencies, P_static * np.ones_like(frequencies) * 1e9, 
+        # Static power is constant, so its end points define the whole line
+        plt.loglog(frequencies[[0, -1]], [P_static * 1e9] * 2, 
                   'b--', label='Static Power', linewidth=2)
-        plt.loglog(frequencies, P_dynamic * 1e9, 'r-', label='Dynamic Power', linewidth=2)
-        plt.loglog(frequencies, P_total * 1e9, 'k-', label='Total Power', linewidth=2)
+        plt.loglog(frequencies, P_plot[0], 'r-', label='Dynamic Power', linewidth=2)
+        plt.loglog(frequencies, P_plot[1], 'k-', label='Total Power', linewidth=2)
         
         plt.xlabel('Frequency (Hz)', fontsize=12)
         plt.ylabel('Power (nW)', fontsize=12)
@@ -282,29 +428,49 @@ class CMOSInverter:
         
         plt.show()
         
-        # Print power at specific frequencies
-        for f in [1e6, 100e6, 1e9]:
-            idx = np.argmin(np.abs(frequencies - f))
+        # Print power at specific frequencies (nearest grid point; frequencies is sorted)
+        targets = np.array([1e6, 100e6, 1e9])
+        indices = np.clip(np.searchsorted(frequencies, targets), 1, frequencies.size - 1)
+        indices -= (targets - frequencies[indices - 1]) < (frequencies[indices] - targets)
+        for f, idx in zip(targets, indices):
             print(f"Power at {f/1e6:.0f} MHz: {P_total[idx]*1e9:.2f} nW")
     
+    def _sweep_vectorized(self, param_name, param_values, points=200):
+        """Solve the VTC for every value of one parameter in a single batched call
+        
+        Returns (Vin, Vout) arrays of shape (len(param_values), points).
+        """
+        values = np.asarray(param_values, dtype=self.dtype).reshape(-1, 1)
+        
+        # Shallow copy whose swept parameter is an (M, 1) column; the current
+        # equations and the solver broadcast it against the (M, N) grid.
+        batch = copy.copy(self)
+        setattr(batch, param_name, values)
+        
+        return batch._solve_batch(values.shape[0], points)
+    
+    def _solve_batch(self, rows, points):
+        """Solve the VTCs of an inverter whose parameters are (rows, 1) columns
+        
+        Each row of the returned (rows, points) Vin runs from 0 to that row's Vdd.
+        """
+        Vdd = np.broadcast_to(np.asarray(self.Vdd, dtype=self.dtype), (rows, 1))
+        Vin = np.linspace(0, Vdd[:, 0], points, axis=-1, dtype=self.dtype)
+        Vout = self._solve_vtc(Vin)
+        return Vin, Vout
+    
     def parameter_sweep(self, param_name, param_values, save_fig=False):
         """Sweep a parameter and show its effect on VTC"""
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(10, 6))
         
-        original_value = getattr(self, param_name)
+        Vin, Vout = self._sweep_vectorized(param_name, param_values)
         
-        for i, value in enumerate(param_values):
-            setattr(self, param_name, value)
-            self.calculate_critical_points()
-            vin, vout = self.generate_vtc()
-            
+        for value, vin, vout in zip(param_values, Vin, Vout):
             plt.plot(vin, vout, linewidth=2, 
                     label=f'{param_name} = {value}' + ('V' if 'V' in param_name else ''))
         
-        # Restore original value
-        setattr(self, param_name, original_value)
-        self.calculate_critical_points()
-        
         plt.xlabel('Input Voltage (V)', fontsize=12)
         plt.ylabel('Output Voltage (V)', fontsize=12)
         plt.title(f'Parameter Sweep: {param_name}', fontsize=14, fontweight='bold')
@@ -342,6 +508,55 @@ class CMOSInverter:
         print(f"  Load Capacitance:       {self.CL*1e12:.1f} pF")
         print("="*60)
 
+def monte_carlo_vtc(nominal, variations, n_samples, seed=42, points=200, dtype=np.float64):
+    """
+    Process-variation Monte Carlo with all samples solved as one batch
+    
+    Args:
+        nominal: Nominal CMOSInverter keyword arguments
+        variations: Relative 3-sigma variation per parameter name
+        n_samples: Number of Monte Carlo samples
+        seed: Random seed (for reproducible results)
+        points: VTC points per sample
+        dtype: Floating point type of the VTC arrays
+    
+    Returns:
+        (Vm, NML, NMH) arrays with one entry per sample; Vm is NaN for
+        samples whose VTC never reaches Vout <= Vin
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Draw every sample at once; varied parameters become (S, 1) columns
+    params = dict(nominal)
+    for param, var in variations.items():
+        if param in params:
+            sigma = var * abs(params[param]) / 3  # 3-sigma
+            samples = params[param] + rng.normal(0, sigma, n_samples)
+            params[param] = samples.astype(dtype).reshape(-1, 1)
+    
+    batch = CMOSInverter(**params, dtype=dtype)
+    Vin, Vout = batch._solve_batch(n_samples, points)
+    
+    # Bracket Vm between the grid points where Vout first drops below Vin,
+    # then bisect every sample at once on the batched solver
+    below = Vout <= Vin
+    k = np.argmax(below, axis=1)
+    rows = np.arange(n_samples)
+    lo = Vin[rows, np.maximum(k - 1, 0)].reshape(-1, 1)
+    hi = Vin[rows, k].reshape(-1, 1)
+    for _ in range(25):  # Vdd/points / 2**25 is well below 1e-8 V
+        mid = 0.5 * (lo + hi)
+        above = batch._solve_vtc(mid) > mid
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    Vm = (0.5 * (lo + hi)).ravel()
+    Vm[~below.any(axis=1)] = np.nan  # argmax returned 0 for these, not a bracket
+    
+    NML = np.broadcast_to(batch.NML, (n_samples, 1)).ravel()
+    NMH = np.broadcast_to(batch.NMH, (n_samples, 1)).ravel()
+    return Vm, NML, NMH
+
+
 def main():
     """Main function demonstrating the CMOS inverter simulation"""
     print("CMOS Inverter Simulation - Advanced Analysis")
@@ -9,7 +9,7 @@ import os
 # Add parent directory to path to import the main module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cmos_inverter_simulation import CMOSInverter
+from cmos_inverter_simulation import CMOSInverter, monte_carlo_vtc
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -227,27 +227,10 @@ def process_variation_monte_carlo():
     
     # Monte Carlo simulation
     n_samples = 100
-    switching_thresholds = []
-    noise_margins_low = []
-    noise_margins_high = []
-    
-    np.random.seed(42)  # For reproducible results
-    
-    for i in range(n_samples):
-        # Generate random variations
-        params = nominal_params.copy()
-        for param, var in variations.items():
-            if param in params:
-                variation = np.random.normal(0, var * params[param] / 3)  # 3-sigma
-                params[param] += variation
-        
-        # Create inverter with varied parameters
-        inverter = CMOSInverter(**params)
-        
-        # Collect statistics
-        switching_thresholds.append(inverter.Vm)
-        noise_margins_low.append(inverter.NML)
-        noise_margins_high.append(inverter.NMH)
+    
+    # All samples are drawn and solved as one batch; histograms only need float32
+    switching_thresholds, noise_margins_low, noise_margins_high = monte_carlo_vtc(
+        nominal_params, variations, n_samples, seed=42, dtype=np.float32)
     
     # Plot histograms
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))